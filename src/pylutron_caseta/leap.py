@@ -1,17 +1,30 @@
 """LEAP protocol layer."""
 
 import asyncio
+from functools import lru_cache
 import json
 import logging
 import re
 import uuid
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from . import BridgeDisconnectedError
 from .messages import Response
 
+try:
+    # orjson is optional, but it is considerably faster and works directly on bytes
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return json.dumps(obj).encode("UTF-8")
+
+    def _json_loads(data: bytes) -> Any:  # type: ignore[misc]
+        return json.loads(data.decode("UTF-8"))
+
+
 _LOG = logging.getLogger(__name__)
-_DEFAULT_LIMIT = 2**18
+_DEFAULT_LIMIT = 2**20
 
 
 def _make_tag() -> str:
@@ -32,6 +45,8 @@ class LeapProtocol:
         self._in_flight_requests: Dict[str, "asyncio.Future[Response]"] = {}
         self._tagged_subscriptions: Dict[str, Callable[[Response], None]] = {}
         self._unsolicited_subs: List[Callable[[Response], None]] = []
+        # concurrent drain() calls are not supported before Python 3.10
+        self._write_lock: Optional[asyncio.Lock] = None
 
     async def request(
         self,
@@ -68,9 +83,19 @@ class LeapProtocol:
         future.add_done_callback(clean_up)
 
         try:
-            text = json.dumps(cmd).encode("UTF-8")
+            text = _json_dumps(cmd)
             _LOG.debug("sending %s", text)
-            self._writer.write(text + b"\r\n")
+            # create the lock on first use so that it binds to the running loop
+            # on Python versions before 3.10
+            if self._write_lock is None:
+                self._write_lock = asyncio.Lock()
+
+            async with self._write_lock:
+                self._writer.writelines((text, b"\r\n"))
+                try:
+                    await self._writer.drain()
+                except ConnectionError as ex:
+                    raise BridgeDisconnectedError() from ex
 
             return await future
         finally:
@@ -78,13 +103,16 @@ class LeapProtocol:
 
     async def run(self):
         """Event monitoring loop."""
-        while not self._reader.at_eof():
-            received = await self._reader.readline()
-
-            if received == b"":
+        while True:
+            try:
+                received = await self._reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError:
+                # the connection was closed, possibly partway through a message
                 break
+            except asyncio.LimitOverrunError as ex:
+                raise ValueError("LEAP message exceeds the stream limit") from ex
 
-            resp_json = json.loads(received.decode("UTF-8"))
+            resp_json = _json_loads(received)
 
             if isinstance(resp_json, dict):
                 tag = resp_json.get("Header", {}).pop("ClientTag", None)
@@ -185,12 +213,18 @@ async def open_connection(
 ) -> LeapProtocol:
     """Open a stream and wrap it with LEAP."""
     reader, writer = await asyncio.open_connection(host, port, limit=limit, **kwds)
+
+    # make drain() wait until each request has been handed to the socket
+    writer.transport.set_write_buffer_limits(0)
+
     return LeapProtocol(reader, writer)
 
 
 _HREFRE = re.compile(r"/(?:\D+)/(\d+)(?:\/\D+)?")
 
 
+# hrefs for the same zones, buttons and LEDs are seen over and over in events
+@lru_cache(maxsize=4096)
 def id_from_href(href: str) -> str:
     """Get an id from any kind of href.
 
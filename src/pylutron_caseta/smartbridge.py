@@ -2,19 +2,24 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
 import logging
 import math
 import socket
 import ssl
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from .color_value import ColorMode, WarmDimmingColorValue
 
-try:
-    from asyncio import get_running_loop as get_loop
-except ImportError:
-    # For Python 3.6 and earlier, we have to use get_event_loop instead
-    from asyncio import get_event_loop as get_loop
-
 from . import (
     _LEAP_DEVICE_TYPES,
     FAN_OFF,
@@ -35,6 +40,12 @@ PING_INTERVAL = 60.0
 CONNECT_TIMEOUT = 5.0
 REQUEST_TIMEOUT = 5.0
 RECONNECT_DELAY = 2.0
+REQUEST_CONCURRENCY = 4
+
+# device types per domain as sets for fast membership tests
+_LEAP_DEVICE_TYPE_SETS = {
+    domain: frozenset(types) for domain, types in _LEAP_DEVICE_TYPES.items()
+}
 
 
 class Smartbridge:
@@ -52,6 +63,8 @@ class Smartbridge:
         self.scenes: Dict[str, dict] = {}
         self.occupancy_groups: Dict[str, dict] = {}
         self.areas: Dict[str, dict] = {}
+        self._devices_by_zone: Dict[str, dict] = {}
+        self._devices_by_type: Dict[str, List[dict]] = {}
         self._connect = connect
         self._subscribers: Dict[str, Callable[[], None]] = {}
         self._occupancy_subscribers: Dict[str, Callable[[], None]] = {}
@@ -102,7 +115,7 @@ class Smartbridge:
             self._login_completed.cancel()
             self._login_completed = asyncio.get_running_loop().create_future()
 
-        self._monitor_task = get_loop().create_task(self._monitor())
+        self._monitor_task = asyncio.get_running_loop().create_task(self._monitor())
 
         await self._login_completed
 
@@ -185,7 +198,7 @@ class Smartbridge:
 
         :param type_: LEAP device type, e.g. WallSwitch
         """
-        return [device for device in self.devices.values() if device["type"] == type_]
+        return list(self._devices_by_type.get(type_, ()))
 
     def get_device_by_zone_id(self, zone_id: str) -> dict:
         """
@@ -196,10 +209,10 @@ class Smartbridge:
         :param zone_id: the zone id to search for
         :raises KeyError: if the zone id is not present
         """
-        for device in self.devices.values():
-            if zone_id == device.get("zone"):
-                return device
-        raise KeyError(f"No device associated with zone {zone_id}")
+        device = self._devices_by_zone.get(zone_id)
+        if device is None:
+            raise KeyError(f"No device associated with zone {zone_id}")
+        return device
 
     def get_devices_by_types(self, types: List[str]) -> List[dict]:
         """
@@ -207,7 +220,11 @@ class Smartbridge:
 
         :param types: list of LEAP device types such as WallSwitch, WallDimmer
         """
-        return [device for device in self.devices.values() if device["type"] in types]
+        return [
+            device
+            for type_ in dict.fromkeys(types)
+            for device in self._devices_by_type.get(type_, ())
+        ]
 
     def get_device_by_id(self, device_id: str) -> dict:
         """
@@ -422,7 +439,10 @@ class Smartbridge:
             )
             return
 
-        if device.get("type") in _LEAP_DEVICE_TYPES["light"] and fade_time is not None:
+        if (
+            device.get("type") in _LEAP_DEVICE_TYPE_SETS["light"]
+            and fade_time is not None
+        ):
             await self._request(
                 "CreateRequest",
                 f"/zone/{zone_id}/commandprocessor",
@@ -540,6 +560,23 @@ class Smartbridge:
         """
         await self.set_value(device_id, 0, **kwargs)
 
+    async def set_values(self, values: Iterable[Tuple[str, int]], **kwargs):
+        """
+        Will set the values for several devices at once.
+
+        Up to REQUEST_CONCURRENCY commands are sent without waiting for each
+        response in turn, which is much faster than calling set_value for each
+        device. If a command fails, the commands that have not finished yet are
+        cancelled and the error is raised.
+
+        :param values: pairs of device id and integer value from 0 to 100 to set
+        :param **kwargs: additional parameters for set_value
+        """
+        await _run_concurrently(
+            partial(self.set_value, device_id, value, **kwargs)
+            for device_id, value in values
+        )
+
     async def activate_scene(self, scene_id: str):
         """
         Will activate the scene with the given ID.
@@ -661,8 +698,9 @@ class Smartbridge:
         if warm_dim is not None:
             device["warm_dim"] = warm_dim
 
-        if device["device_id"] in self._subscribers:
-            self._subscribers[device["device_id"]]()
+        subscriber = self._subscribers.get(device["device_id"])
+        if subscriber is not None:
+            subscriber()
 
     def _handle_button_status(self, response: Response):
         _LOG.debug("Handling button status: %s", response)
@@ -797,6 +835,9 @@ class Smartbridge:
                 # integration
                 await self._load_ra3_processor()
                 await self._load_ra3_devices()
+                self._index_devices()
+                # caseta does this by default, but we need to do it manually for RA3
+                await self._subscribe_to_multi_zone_status()
                 await self._subscribe_to_button_status()
                 await self._load_ra3_occupancy_groups()
                 await self._subscribe_to_ra3_occupancy_groups()
@@ -805,6 +846,7 @@ class Smartbridge:
                 _LOG.debug("Caseta bridge detected")
 
                 await self._load_devices()
+                self._index_devices()
                 await self._load_buttons()
                 await self._load_lip_devices()
                 await self._load_scenes()
@@ -812,13 +854,7 @@ class Smartbridge:
                 await self._subscribe_to_occupancy_groups()
                 await self._subscribe_to_button_status()
 
-                for device in self.devices.values():
-                    if device.get("zone") is not None:
-                        _LOG.debug("Requesting zone information from %s", device)
-                        response = await self._request(
-                            "ReadRequest", f"/zone/{device['zone']}/status"
-                        )
-                        self._handle_one_zone_status(response)
+                await self._load_zone_statuses()
 
             if not self._login_completed.done():
                 self._login_completed.set_result(None)
@@ -899,14 +935,35 @@ class Smartbridge:
                 area=area_id,
             )
 
+    def _index_devices(self):
+        """Rebuild the lookup tables derived from the device list."""
+        self._devices_by_zone = {}
+        self._devices_by_type = {}
+        for device in self.devices.values():
+            zone_id = device.get("zone")
+            if zone_id is not None:
+                self._devices_by_zone.setdefault(zone_id, device)
+            self._devices_by_type.setdefault(device["type"], []).append(device)
+
+    async def _load_zone_statuses(self):
+        """Read the current status of every zone, a few requests at a time."""
+
+        async def _load_zone_status(zone_id: str):
+            _LOG.debug("Requesting zone information from zone %s", zone_id)
+            response = await self._request("ReadRequest", f"/zone/{zone_id}/status")
+            self._handle_one_zone_status(response)
+
+        await _run_concurrently(
+            partial(_load_zone_status, device["zone"])
+            for device in self.devices.values()
+            if device.get("zone") is not None
+        )
+
     async def _load_ra3_devices(self):
         for area in self.areas.values():
             await self._load_ra3_control_stations(area)
             await self._load_ra3_zones(area)
 
-        # caseta does this by default, but we need to do it manually for RA3
-        await self._subscribe_to_multi_zone_status()
-
     async def _load_ra3_processor(self):
         # Load processor as devices[1] for compatibility with lutron_caseta HA
         # integration
@@ -974,7 +1031,7 @@ class Smartbridge:
         device_type = device_json["Device"]["DeviceType"]
 
         # ignore non-button devices
-        if device_type not in _LEAP_DEVICE_TYPES.get("sensor"):
+        if device_type not in _LEAP_DEVICE_TYPE_SETS["sensor"]:
             return
 
         button_group_json = await self._request(
@@ -1414,6 +1471,35 @@ class Smartbridge:
             self._ping_task.cancel()
 
 
+async def _run_concurrently(calls: Iterable[Callable[[], Awaitable[Any]]]):
+    """
+    Run calls concurrently, at most REQUEST_CONCURRENCY at a time.
+
+    Each call's request timeout only starts once it is running, rather than
+    while it waits behind the others. If a call fails, the calls that have not
+    finished yet are cancelled and the exception is raised.
+    """
+    semaphore = asyncio.Semaphore(REQUEST_CONCURRENCY)
+
+    async def _run(call: Callable[[], Awaitable[Any]]):
+        async with semaphore:
+            try:
+                await call()
+            except Exception:
+                # cancel the others before releasing the semaphore lets one start
+                for task in tasks:
+                    if task is not asyncio.current_task():
+                        task.cancel()
+                raise
+
+    tasks = [asyncio.ensure_future(_run(call)) for call in calls]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 def _format_duration(duration: timedelta) -> str:
     """Convert a timedelta to the hh:mm:ss format used in LEAP."""
     total_seconds = math.floor(duration.total_seconds())
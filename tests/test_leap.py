@@ -143,6 +143,15 @@ async def test_read_eof(pipe):
     await pipe.leap_loop
 
 
+@pytest.mark.asyncio
+async def test_read_eof_partial(pipe):
+    """Test reading when EOF is encountered in the middle of a message."""
+    pipe.test_writer.write(b'{"CommuniqueType": ')
+    pipe.test_writer.close()
+
+    await pipe.leap_loop
+
+
 @pytest.mark.asyncio
 async def test_read_invalid(pipe):
     """Test reading when invalid data is received."""
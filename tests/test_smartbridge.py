@@ -32,6 +32,7 @@ from pylutron_caseta import (
     OCCUPANCY_GROUP_UNKNOWN,
     BUTTON_STATUS_PRESSED,
     BridgeDisconnectedError,
+    BridgeResponseError,
     smartbridge,
     color_value,
 )
@@ -278,31 +279,40 @@ class Bridge:
             response.set_result(self.button_subscription_data_result)
             leap.requests.task_done()
 
-        # Check the zone status on each zone
+        # Check the zone status on each zone. The requests should be in flight
+        # together, but no more than REQUEST_CONCURRENCY at a time.
         requested_zones = []
-        for _ in range(0, 4):
-            request, response = await wait(leap.requests.get())
-            logging.info("Read %s", request)
-            assert request.communique_type == "ReadRequest"
-            requested_zones.append(request.url)
-            response.set_result(
-                Response(
-                    CommuniqueType="ReadResponse",
-                    Header=ResponseHeader(
-                        MessageBodyType="OneZoneStatus",
-                        StatusCode=ResponseStatus(200, "OK"),
-                        Url=request.url,
-                    ),
-                    Body={
-                        "ZoneStatus": {
-                            "href": request.url,
-                            "Zone": {"href": request.url.replace("/status", "")},
-                            "StatusAccuracy": "Good",
-                        }
-                    },
+        remaining = 4
+        while remaining > 0:
+            batch = []
+            for _ in range(min(remaining, smartbridge.REQUEST_CONCURRENCY)):
+                batch.append(await wait(leap.requests.get()))
+            await asyncio.sleep(0)
+            assert leap.requests.empty(), "too many zone status requests in flight"
+
+            for request, response in batch:
+                logging.info("Read %s", request)
+                assert request.communique_type == "ReadRequest"
+                requested_zones.append(request.url)
+                response.set_result(
+                    Response(
+                        CommuniqueType="ReadResponse",
+                        Header=ResponseHeader(
+                            MessageBodyType="OneZoneStatus",
+                            StatusCode=ResponseStatus(200, "OK"),
+                            Url=request.url,
+                        ),
+                        Body={
+                            "ZoneStatus": {
+                                "href": request.url,
+                                "Zone": {"href": request.url.replace("/status", "")},
+                                "StatusAccuracy": "Good",
+                            }
+                        },
+                    )
                 )
-            )
-            leap.requests.task_done()
+                leap.requests.task_done()
+            remaining -= len(batch)
         requested_zones.sort()
         assert requested_zones == [
             "/zone/1/status",
@@ -1021,6 +1031,18 @@ async def test_initialization_without_buttons(bridge_uninit: Bridge):
     assert bridge.target.buttons == {}
 
 
+@pytest.mark.asyncio
+async def test_initialization_zone_status_concurrency(
+    bridge_uninit: Bridge, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the initial zone status requests are limited in number."""
+    monkeypatch.setattr(smartbridge, "REQUEST_CONCURRENCY", 2)
+
+    await bridge_uninit.initialize()
+
+    assert bridge_uninit.target.is_connected()
+
+
 @pytest.mark.asyncio
 async def test_occupancy_no_bodies(bridge_uninit: Bridge):
     """Test the that the bridge initializes even if no occupancy status is returned."""
@@ -1346,6 +1368,89 @@ async def test_set_value_with_fade(bridge: Bridge):
     task.cancel()
 
 
+@pytest.mark.asyncio
+async def test_set_values(bridge: Bridge):
+    """Test that setting several values sends all commands before waiting."""
+    task = asyncio.get_running_loop().create_task(
+        bridge.target.set_values([("2", 50), ("3", 0)])
+    )
+
+    commands = []
+    responses = []
+    for _ in range(2):
+        command, response = await bridge.leap.requests.get()
+        commands.append(command)
+        responses.append(response)
+
+    assert commands == [
+        Request(
+            communique_type="CreateRequest",
+            url="/zone/1/commandprocessor",
+            body={
+                "Command": {
+                    "CommandType": "GoToLevel",
+                    "Parameter": [{"Type": "Level", "Value": 50}],
+                }
+            },
+        ),
+        Request(
+            communique_type="CreateRequest",
+            url="/zone/2/commandprocessor",
+            body={
+                "Command": {
+                    "CommandType": "GoToLevel",
+                    "Parameter": [{"Type": "Level", "Value": 0}],
+                }
+            },
+        ),
+    ]
+
+    for command, response in zip(commands, responses):
+        response.set_result(
+            Response(
+                CommuniqueType="CreateResponse",
+                Header=ResponseHeader(
+                    StatusCode=ResponseStatus(201, "Created"),
+                    Url=command.url,
+                ),
+            )
+        )
+        bridge.leap.requests.task_done()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_set_values_limited(bridge: Bridge, monkeypatch: pytest.MonkeyPatch):
+    """Test that set_values limits concurrent commands and stops on failure."""
+    monkeypatch.setattr(smartbridge, "REQUEST_CONCURRENCY", 1)
+
+    task = asyncio.get_running_loop().create_task(
+        bridge.target.set_values([("2", 50), ("3", 0), ("2", 0)])
+    )
+
+    command, response = await bridge.leap.requests.get()
+    assert command.url == "/zone/1/commandprocessor"
+    await asyncio.sleep(0)
+    assert bridge.leap.requests.empty(), "too many commands in flight"
+
+    response.set_result(
+        Response(
+            CommuniqueType="ExceptionResponse",
+            Header=ResponseHeader(
+                StatusCode=ResponseStatus(500, "Internal Server Error"),
+                Url=command.url,
+            ),
+        )
+    )
+    bridge.leap.requests.task_done()
+
+    with pytest.raises(BridgeResponseError):
+        await task
+
+    await asyncio.sleep(0)
+    assert bridge.leap.requests.empty(), "remaining commands were not cancelled"
+
+
 @pytest.mark.asyncio
 async def test_set_fan(bridge: Bridge):
     """Test that setting fan speed produces the right commands."""
@@ -2788,6 +2893,26 @@ async def test_get_devices_by_invalid_domain(bridge: Bridge):
     assert devices == []
 
 
+@pytest.mark.asyncio
+async def test_get_devices_by_domain_returns_copy(bridge: Bridge):
+    """Tests that modifying a returned device list does not affect later queries."""
+    devices = bridge.target.get_devices_by_domain("cover")
+    assert [device["device_id"] for device in devices] == ["7", "10"]
+
+    devices.clear()
+
+    devices = bridge.target.get_devices_by_domain("cover")
+    assert [device["device_id"] for device in devices] == ["7", "10"]
+
+
+@pytest.mark.asyncio
+async def test_get_device_by_zone_id(bridge: Bridge):
+    """Tests that devices can be looked up by their zone."""
+    device = bridge.target.get_device_by_zone_id("1")
+    assert device["device_id"] == "2"
+    assert device is bridge.target.get_device_by_id("2")
+
+
 @pytest.mark.asyncio
 async def test_qsx_get_devices_for_invalid_zone(qsx_processor: Bridge):
     """Tests that getting devices for an invalid zone raises an exception."""